@@ -37,6 +37,7 @@ import pendulum
 from pydantic import BaseModel, ConfigDict, ValidationError
 from typing_extensions import NotRequired
 
+from airflow._shared.logging import init_log_folder
 from airflow.configuration import conf
 from airflow.executors.executor_loader import ExecutorLoader
 from airflow.utils.helpers import parse_template_string, render_template
@@ -812,9 +813,7 @@ class FileTaskHandler(logging.Handler):
         sure that the same group is set as default group for both - impersonated user and main airflow
         user.
         """
-        for parent in reversed(directory.parents):
-            parent.mkdir(mode=new_folder_permissions, exist_ok=True)
-        directory.mkdir(mode=new_folder_permissions, exist_ok=True)
+        init_log_folder(directory, new_folder_permissions)
 
     def _init_file(self, ti, *, identifier: str | None = None):
         """
@@ -19,17 +19,93 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from typing import TYPE_CHECKING, Any
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from functools import cache
+from typing import TYPE_CHECKING, Any, ClassVar
+from urllib.parse import quote
 
-from googleapiclient.discovery import build
+import google_auth_httplib2
+from aiohttp import ClientSession
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http, set_user_agent
 
+from airflow import version
 from airflow.exceptions import AirflowException
-from airflow.providers.google.common.hooks.base_google import GoogleBaseHook
+from airflow.providers.google.common.hooks.base_google import GoogleBaseAsyncHook, GoogleBaseHook
 
 if TYPE_CHECKING:
     from datetime import datetime
 
+    import httplib2
+
+# Maximum number of calls a single Calendar API batch request may contain.
+BATCH_REQUEST_LIMIT = 50
+
+# Reasons of the 403 errors returned when a Calendar API rate limit is hit, which are worth retrying.
+RATE_LIMIT_REASONS = (b"rateLimitExceeded", b"userRateLimitExceeded")
+
+
+class GoogleCalendarBatchError(AirflowException):
+    """
+    Raised when some events of :meth:`GoogleCalendarHook.create_events_batch` could not be created.
+
+    :param created: The created events, keyed by their index in the requested ``events``.
+    :param errors: The error of every event that could not be created, keyed by the same index.
+    """
+
+    def __init__(self, created: dict[int, dict], errors: dict[int, Exception]) -> None:
+        first_index = min(errors)
+        super().__init__(
+            f"{len(errors)} of {len(created) + len(errors)} events could not be created, "
+            f"the first one (index {first_index}) failed with: {errors[first_index]}"
+        )
+        self.created = created
+        self.errors = errors
+
+
+def _is_retryable_batch_error(exception: Exception) -> bool:
+    """Check whether a failed request of a batch was rate limited or hit a server error."""
+    if not isinstance(exception, HttpError):
+        return False
+    status = exception.resp.status
+    if status == 403:
+        return any(reason in exception.content for reason in RATE_LIMIT_REASONS)
+    return status == 429 or status >= 500
+
+
+@cache
+def _get_discovery_document(api_version: str) -> dict[str, Any] | None:
+    """
+    Return the parsed Calendar discovery document shipped with ``google-api-python-client``.
+
+    The document is parsed once per process and api version, so repeated ``get_conn`` calls do not
+    pay for loading and parsing it again. ``None`` is returned if the version is not bundled.
+    """
+    document = get_static_doc("calendar", api_version)
+    if document is None:
+        return None
+    return json.loads(document)
+
+
+class _ThreadLocalHttp:
+    """
+    Stand-in for ``httplib2.Http`` which forwards to the shared transport of the calling thread.
+
+    It is looked up again for every request, so a service built in one thread and used from another never
+    shares connections with the hooks of the thread which built it.
+    """
+
+    def __init__(self, get_http: Callable[[], httplib2.Http]) -> None:
+        self._get_http = get_http
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_http(), name)
+
 
 class GoogleCalendarHook(GoogleBaseHook):
     """
@@ -49,6 +125,12 @@ class GoogleCalendarHook(GoogleBaseHook):
         account from the list granting this role to the originating account.
     """
 
+    # HTTP transport shared by the hook instances running in the same thread, so that connections (and
+    # their TLS sessions) are reused across hooks. ``httplib2.Http`` is not thread-safe, so every thread
+    # gets its own, looked up when each request is sent. Credentials are still attached per hook in
+    # ``_authorize``.
+    _http_pools: ClassVar[threading.local] = threading.local()
+
     def __init__(
         self,
         api_version: str,
@@ -62,6 +144,31 @@ class GoogleCalendarHook(GoogleBaseHook):
         self.api_version = api_version
         self._conn = None
 
+    @classmethod
+    def _get_http_pool(cls) -> httplib2.Http:
+        http = getattr(cls._http_pools, "http", None)
+        if http is None:
+            http = cls._http_pools.http = set_user_agent(build_http(), "airflow/" + version.version)
+        return http
+
+    @classmethod
+    def close(cls) -> None:
+        """
+        Close the connections of the HTTP transport used by Google Calendar hooks in the calling thread.
+
+        This applies to all hooks of the process that run in this thread, not only to the hook it is called
+        on. Transports of other threads are left untouched, as they may be in the middle of a request.
+        """
+        if (http := getattr(cls._http_pools, "http", None)) is not None:
+            http.close()
+            del cls._http_pools.http
+
+    def _authorize(self) -> google_auth_httplib2.AuthorizedHttp:
+        """Return an authorized HTTP object which reuses the connections of the calling thread's transport."""
+        return google_auth_httplib2.AuthorizedHttp(
+            self.get_credentials(), http=_ThreadLocalHttp(self._get_http_pool)
+        )
+
     def get_conn(self) -> Any:
         """
         Retrieve connection to Google Calendar.
@@ -70,7 +177,10 @@ class GoogleCalendarHook(GoogleBaseHook):
         """
         if not self._conn:
             http_authorized = self._authorize()
-            self._conn = build("calendar", self.api_version, http=http_authorized, cache_discovery=False)
+            if (discovery_document := _get_discovery_document(self.api_version)) is not None:
+                self._conn = build_from_document(discovery_document, http=http_authorized)
+            else:
+                self._conn = build("calendar", self.api_version, http=http_authorized, cache_discovery=False)
 
         return self._conn
 
@@ -92,6 +202,7 @@ class GoogleCalendarHook(GoogleBaseHook):
         time_min: datetime | None = None,
         time_zone: str | None = None,
         updated_min: datetime | None = None,
+        fields: str | None = None,
     ) -> list:
         """
         Get events from Google Calendar from a single calendar_id.
@@ -123,10 +234,61 @@ class GoogleCalendarHook(GoogleBaseHook):
             Default is no filter
         :param time_zone: Optional. Time zone used in response. Default is calendars time zone.
         :param updated_min: Optional. Lower bound for an event's last modification time
+        :param fields: Optional. Selector of the fields to include in the response, for example
+            ``"items(id,summary,start,end),nextPageToken"``. ``items`` and ``nextPageToken`` must be
+            selected for the events and the following pages to be returned.
+            https://developers.google.com/calendar/api/guides/performance#partial-response
+        """
+        return list(
+            self.iter_events(
+                calendar_id=calendar_id,
+                i_cal_uid=i_cal_uid,
+                max_attendees=max_attendees,
+                max_results=max_results,
+                order_by=order_by,
+                private_extended_property=private_extended_property,
+                q=q,
+                shared_extended_property=shared_extended_property,
+                show_deleted=show_deleted,
+                show_hidden_invitation=show_hidden_invitation,
+                single_events=single_events,
+                sync_token=sync_token,
+                time_max=time_max,
+                time_min=time_min,
+                time_zone=time_zone,
+                updated_min=updated_min,
+                fields=fields,
+            )
+        )
+
+    def iter_events(
+        self,
+        calendar_id: str = "primary",
+        i_cal_uid: str | None = None,
+        max_attendees: int | None = None,
+        max_results: int | None = None,
+        order_by: str | None = None,
+        private_extended_property: str | None = None,
+        q: str | None = None,
+        shared_extended_property: str | None = None,
+        show_deleted: bool | None = False,
+        show_hidden_invitation: bool | None = False,
+        single_events: bool | None = False,
+        sync_token: str | None = None,
+        time_max: datetime | None = None,
+        time_min: datetime | None = None,
+        time_zone: str | None = None,
+        updated_min: datetime | None = None,
+        fields: str | None = None,
+    ) -> Iterator[dict]:
+        """
+        Iterate over events from Google Calendar from a single calendar_id.
+
+        Events are yielded page by page as they are fetched, so callers processing them one at a time do
+        not need to hold all pages in memory. Accepts the same parameters as :meth:`get_events`.
         """
         service = self.get_conn()
         page_token = None
-        events = []
         while True:
             response = (
                 service.events()
@@ -148,14 +310,14 @@ class GoogleCalendarHook(GoogleBaseHook):
                     timeMin=time_min,
                     timeZone=time_zone,
                     updatedMin=updated_min,
+                    fields=fields,
                 )
                 .execute(num_retries=self.num_retries)
             )
-            events.extend(response["items"])
+            yield from response["items"]
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
-        return events
 
     def create_event(
         self,
@@ -166,6 +328,7 @@ class GoogleCalendarHook(GoogleBaseHook):
         send_notifications: bool | None = False,
         send_updates: str | None = "false",
         supports_attachments: bool | None = False,
+        fields: str | None = None,
     ) -> dict:
         """
         Create event on the specified calendar.
@@ -181,12 +344,11 @@ class GoogleCalendarHook(GoogleBaseHook):
         :param send_updates: Optional. Default is "false". Acceptable values as "all", "none",
             ``"externalOnly"``
             https://developers.google.com/calendar/api/v3/reference/events#resource
+        :param fields: Optional. Selector of the fields of the created event to include in the
+            response, for example ``"id,htmlLink"``.
+            https://developers.google.com/calendar/api/guides/performance#partial-response
         """
-        if "start" not in event or "end" not in event:
-            raise AirflowException(
-                f"start and end must be specified in the event body while creating an event. API docs:"
-                f"https://developers.google.com/calendar/api/{self.api_version}/reference/events/insert "
-            )
+        self._validate_event(event)
         service = self.get_conn()
 
         response = (
@@ -199,8 +361,234 @@ class GoogleCalendarHook(GoogleBaseHook):
                 sendUpdates=send_updates,
                 supportsAttachments=supports_attachments,
                 body=event,
+                fields=fields,
             )
             .execute(num_retries=self.num_retries)
         )
 
         return response
+
+    def create_events_batch(
+        self,
+        events: Sequence[dict[str, Any]],
+        calendar_id: str = "primary",
+        conference_data_version: int | None = 0,
+        max_attendees: int | None = None,
+        send_notifications: bool | None = False,
+        send_updates: str | None = None,
+        supports_attachments: bool | None = False,
+        fields: str | None = None,
+    ) -> list[dict]:
+        """
+        Create multiple events on the specified calendar using batch requests.
+
+        Inserts are packed into batch requests of up to 50 events each, so a single HTTP round-trip
+        is paid per batch rather than per event. All requests in a batch are sent with the same
+        service object, and therefore with the same credentials and ``impersonation_chain``.
+
+        Events whose insert was rate limited or failed with a server error are sent again in new batches,
+        up to ``num_retries`` times with exponential backoff. All events are attempted before any error is
+        raised, so the :class:`GoogleCalendarBatchError` raised for the remaining failures tells which
+        events were created and which were not.
+
+        https://developers.google.com/calendar/api/guides/batch
+
+        Accepts the same parameters as :meth:`create_event`, except that ``send_updates`` defaults to
+        ``None`` (the API default).
+
+        :param events: The event bodies to create.
+        :return: The created events, in the same order as ``events``.
+        """
+        for event in events:
+            self._validate_event(event)
+        service = self.get_conn()
+
+        created: dict[int, dict] = {}
+        errors: dict[int, Exception] = {}
+
+        def _callback(request_id: str, response: dict, exception: Exception | None) -> None:
+            index = int(request_id)
+            if exception is not None:
+                errors[index] = exception
+            else:
+                created[index] = response
+                errors.pop(index, None)
+
+        pending = list(range(len(events)))
+        for attempt in range(self.num_retries + 1):
+            if attempt:
+                # Wait with exponential backoff scheme before retrying.
+                time.sleep(2**attempt)
+
+            for chunk_start in range(0, len(pending), BATCH_REQUEST_LIMIT):
+                chunk = pending[chunk_start : chunk_start + BATCH_REQUEST_LIMIT]
+                batch = service.new_batch_http_request(callback=_callback)
+                for index in chunk:
+                    batch.add(
+                        service.events().insert(
+                            calendarId=calendar_id,
+                            conferenceDataVersion=conference_data_version,
+                            maxAttendees=max_attendees,
+                            sendNotifications=send_notifications,
+                            sendUpdates=send_updates,
+                            supportsAttachments=supports_attachments,
+                            body=events[index],
+                            fields=fields,
+                        ),
+                        request_id=str(index),
+                    )
+                try:
+                    batch.execute()
+                except HttpError as e:
+                    # The batch request as a whole failed, so none of its events were handled
+                    errors.update((index, e) for index in chunk if index not in created)
+
+            pending = sorted(index for index, error in errors.items() if _is_retryable_batch_error(error))
+            if not pending:
+                break
+
+        if errors:
+            raise GoogleCalendarBatchError(created=created, errors=errors)
+        return [created[index] for index in range(len(events))]
+
+    def _validate_event(self, event: dict[str, Any]) -> None:
+        if "start" not in event or "end" not in event:
+            raise AirflowException(
+                f"start and end must be specified in the event body while creating an event. API docs:"
+                f"https://developers.google.com/calendar/api/{self.api_version}/reference/events/insert "
+            )
+
+
+class GoogleCalendarAsyncHook(GoogleBaseAsyncHook):
+    """
+    Asynchronous hook for Google Calendar.
+
+    Pages are fetched over the Calendar REST API with ``aiohttp``, so fetching events from several
+    calendars can be awaited concurrently (for example with ``asyncio.gather``) instead of paying the
+    latency of every page in sequence.
+    """
+
+    sync_hook_class = GoogleCalendarHook
+
+    def __init__(
+        self,
+        api_version: str,
+        gcp_conn_id: str = "google_cloud_default",
+        impersonation_chain: str | Sequence[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            api_version=api_version,
+            gcp_conn_id=gcp_conn_id,
+            impersonation_chain=impersonation_chain,
+            **kwargs,
+        )
+        self.api_version = api_version
+
+    def _events_url(self, calendar_id: str) -> str:
+        return (
+            f"https://www.googleapis.com/calendar/{self.api_version}/calendars/{quote(calendar_id, safe='')}"
+            "/events"
+        )
+
+    @staticmethod
+    def _to_query_params(params: dict[str, Any]) -> dict[str, str]:
+        query_params = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                query_params[key] = str(value).lower()
+            elif hasattr(value, "isoformat"):
+                query_params[key] = value.isoformat()
+            else:
+                query_params[key] = str(value)
+        return query_params
+
+    async def get_events(
+        self,
+        calendar_id: str = "primary",
+        i_cal_uid: str | None = None,
+        max_attendees: int | None = None,
+        max_results: int | None = None,
+        order_by: str | None = None,
+        private_extended_property: str | None = None,
+        q: str | None = None,
+        shared_extended_property: str | None = None,
+        show_deleted: bool | None = False,
+        show_hidden_invitation: bool | None = False,
+        single_events: bool | None = False,
+        sync_token: str | None = None,
+        time_max: datetime | None = None,
+        time_min: datetime | None = None,
+        time_zone: str | None = None,
+        updated_min: datetime | None = None,
+        fields: str | None = None,
+        session: ClientSession | None = None,
+    ) -> list:
+        """
+        Get events from Google Calendar from a single calendar_id asynchronously.
+
+        Accepts the same parameters as :meth:`GoogleCalendarHook.get_events`.
+
+        :param session: Optional. ``aiohttp`` session to issue the requests with. Pass a shared session
+            when fetching several calendars concurrently, otherwise a new one is opened for this call.
+        """
+        if session is None:
+            async with ClientSession() as new_session:
+                return await self.get_events(
+                    calendar_id=calendar_id,
+                    i_cal_uid=i_cal_uid,
+                    max_attendees=max_attendees,
+                    max_results=max_results,
+                    order_by=order_by,
+                    private_extended_property=private_extended_property,
+                    q=q,
+                    shared_extended_property=shared_extended_property,
+                    show_deleted=show_deleted,
+                    show_hidden_invitation=show_hidden_invitation,
+                    single_events=single_events,
+                    sync_token=sync_token,
+                    time_max=time_max,
+                    time_min=time_min,
+                    time_zone=time_zone,
+                    updated_min=updated_min,
+                    fields=fields,
+                    session=new_session,
+                )
+
+        token = await self.get_token(session=session)
+        url = self._events_url(calendar_id)
+        params = self._to_query_params(
+            {
+                "iCalUID": i_cal_uid,
+                "maxAttendees": max_attendees,
+                "maxResults": max_results,
+                "orderBy": order_by,
+                "privateExtendedProperty": private_extended_property,
+                "q": q,
+                "sharedExtendedProperty": shared_extended_property,
+                "showDeleted": show_deleted,
+                "showHiddenInvitations": show_hidden_invitation,
+                "singleEvents": single_events,
+                "syncToken": sync_token,
+                "timeMax": time_max,
+                "timeMin": time_min,
+                "timeZone": time_zone,
+                "updatedMin": updated_min,
+                "fields": fields,
+            }
+        )
+        page_token = None
+        events = []
+        while True:
+            headers = {"Authorization": f"Bearer {await token.get()}"}
+            page_params = {**params, "pageToken": page_token} if page_token else params
+            async with session.get(url, params=page_params, headers=headers) as response:
+                response.raise_for_status()
+                data = await response.json()
+            events.extend(data["items"])
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                break
+        return events
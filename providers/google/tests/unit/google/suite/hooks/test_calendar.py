@@ -21,9 +21,20 @@ Unit Tests for the Google Calendar Hook
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
-from airflow.providers.google.suite.hooks.calendar import GoogleCalendarHook
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from airflow.exceptions import AirflowException
+from airflow.providers.google.suite.hooks.calendar import (
+    GoogleCalendarAsyncHook,
+    GoogleCalendarBatchError,
+    GoogleCalendarHook,
+    _get_discovery_document,
+)
 
 from unit.google.cloud.utils.base_gcp_mock import mock_base_gcp_hook_default_project_id
 
@@ -54,6 +65,89 @@ class TestGoogleCalendarHook:
         ):
             self.hook = GoogleCalendarHook(api_version=API_VERSION, gcp_conn_id=GCP_CONN_ID)
 
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook._authorize")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.build")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.build_from_document")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.get_static_doc")
+    def test_get_conn_uses_cached_discovery_document(
+        self, mock_get_static_doc, mock_build_from_document, mock_build, mock_authorize
+    ):
+        _get_discovery_document.cache_clear()
+        mock_get_static_doc.return_value = '{"name": "calendar"}'
+
+        result = self.hook.get_conn()
+        self.hook._conn = None
+        self.hook.get_conn()
+
+        mock_get_static_doc.assert_called_once_with("calendar", API_VERSION)
+        mock_build_from_document.assert_called_with({"name": "calendar"}, http=mock_authorize.return_value)
+        mock_build.assert_not_called()
+        assert result == mock_build_from_document.return_value
+        _get_discovery_document.cache_clear()
+
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook._authorize")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.build")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.get_static_doc", return_value=None)
+    def test_get_conn_without_bundled_discovery_document(
+        self, mock_get_static_doc, mock_build, mock_authorize
+    ):
+        _get_discovery_document.cache_clear()
+
+        result = self.hook.get_conn()
+
+        mock_build.assert_called_once_with(
+            "calendar", API_VERSION, http=mock_authorize.return_value, cache_discovery=False
+        )
+        assert result == mock_build.return_value
+        _get_discovery_document.cache_clear()
+
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_credentials")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.build_http")
+    def test_authorize_shares_http_transport(self, mock_build_http, mock_get_credentials):
+        GoogleCalendarHook.close()
+        with mock.patch(
+            "airflow.providers.google.common.hooks.base_google.GoogleBaseHook.__init__",
+            new=mock_base_gcp_hook_default_project_id,
+        ):
+            other_hook = GoogleCalendarHook(api_version=API_VERSION, gcp_conn_id=GCP_CONN_ID)
+
+        first = self.hook._authorize()
+        second = other_hook._authorize()
+
+        assert first.http.connections is second.http.connections
+        mock_build_http.assert_called_once()
+        assert first.credentials is mock_get_credentials.return_value
+
+        GoogleCalendarHook.close()
+        mock_build_http.return_value.close.assert_called_once()
+        assert not hasattr(GoogleCalendarHook._http_pools, "http")
+
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_credentials")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.build_http")
+    def test_authorize_uses_http_transport_per_thread(self, mock_build_http, mock_get_credentials):
+        GoogleCalendarHook.close()
+        transports = []
+
+        def build_http():
+            transports.append(mock.MagicMock())
+            return transports[-1]
+
+        mock_build_http.side_effect = build_http
+        authorized = self.hook._authorize()
+
+        # The transport is looked up when a request is sent, so each thread using the service gets its own
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread_connections = executor.submit(lambda: authorized.http.connections).result()
+        this_thread_connections = authorized.http.connections
+
+        other_thread_http, this_thread_http = transports
+        assert other_thread_connections is other_thread_http.connections
+        assert this_thread_connections is this_thread_http.connections
+
+        GoogleCalendarHook.close()
+        this_thread_http.close.assert_called_once()
+        other_thread_http.close.assert_not_called()
+
     @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_conn")
     def test_get_events(self, get_conn):
         get_method = get_conn.return_value.events.return_value.list
@@ -80,8 +174,35 @@ class TestGoogleCalendarHook:
             timeMin=None,
             timeZone=None,
             updatedMin=None,
+            fields=None,
         )
 
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_conn")
+    def test_get_events_with_fields(self, get_conn):
+        get_method = get_conn.return_value.events.return_value.list
+        get_method.return_value.execute.return_value = {"items": [{"id": "event"}]}
+
+        result = self.hook.get_events(calendar_id=CALENDAR_ID, fields="items(id),nextPageToken")
+
+        assert result == [{"id": "event"}]
+        assert get_method.call_args.kwargs["fields"] == "items(id),nextPageToken"
+
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_conn")
+    def test_iter_events_fetches_pages_lazily(self, get_conn):
+        get_method = get_conn.return_value.events.return_value.list
+        execute_method = get_method.return_value.execute
+        execute_method.side_effect = [
+            {"kind": "calendar#events", "nextPageToken": "page-2", "items": [EVENT]},
+            {"kind": "calendar#events", "items": [EVENT]},
+        ]
+
+        events = self.hook.iter_events(calendar_id=CALENDAR_ID)
+        assert next(events) == EVENT
+        assert execute_method.call_count == 1
+        assert list(events) == [EVENT]
+        assert execute_method.call_count == 2
+        assert get_method.call_args.kwargs["pageToken"] == "page-2"
+
     @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_conn")
     def test_create_event(self, mock_get_conn):
         create_mock = mock_get_conn.return_value.events.return_value.insert
@@ -97,5 +218,132 @@ class TestGoogleCalendarHook:
             sendNotifications=False,
             sendUpdates="false",
             supportsAttachments=False,
+            fields=None,
         )
         assert result == API_RESPONSE
+
+    @staticmethod
+    def _mock_batches(service, failures=None):
+        """Answer every insert of a batch with ``{"id": request_id}``, or the next error in ``failures``."""
+        batches = []
+        failures = failures or {}
+
+        def new_batch_http_request(callback):
+            batch = mock.MagicMock()
+            added = []
+            batch.add.side_effect = lambda request, request_id: added.append(request_id)
+
+            def execute():
+                for rid in added:
+                    if failures.get(rid):
+                        callback(rid, None, failures[rid].pop(0))
+                    else:
+                        callback(rid, {"id": rid}, None)
+
+            batch.execute.side_effect = execute
+            batches.append(batch)
+            return batch
+
+        service.new_batch_http_request.side_effect = new_batch_http_request
+        return batches
+
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_conn")
+    def test_create_events_batch(self, mock_get_conn):
+        service = mock_get_conn.return_value
+        batches = self._mock_batches(service)
+
+        result = self.hook.create_events_batch(events=[EVENT] * 51, calendar_id=CALENDAR_ID)
+
+        assert result == [{"id": str(i)} for i in range(51)]
+        assert [batch.add.call_count for batch in batches] == [50, 1]
+        assert service.events.return_value.insert.call_count == 51
+        service.events.return_value.insert.assert_called_with(
+            body=EVENT,
+            calendarId=CALENDAR_ID,
+            conferenceDataVersion=0,
+            maxAttendees=None,
+            sendNotifications=False,
+            sendUpdates=None,
+            supportsAttachments=False,
+            fields=None,
+        )
+
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.time.sleep")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_conn")
+    def test_create_events_batch_retries_rate_limited_events(self, mock_get_conn, mock_sleep):
+        rate_limited = HttpError(
+            resp=httplib2.Response({"status": 403}),
+            content=b'{"error": {"errors": [{"reason": "rateLimitExceeded"}]}}',
+        )
+        server_error = HttpError(resp=httplib2.Response({"status": 503}), content=b"Backend Error")
+        batches = self._mock_batches(
+            mock_get_conn.return_value, failures={"1": [rate_limited, server_error], "2": [server_error]}
+        )
+
+        result = self.hook.create_events_batch(events=[EVENT] * 3, calendar_id=CALENDAR_ID)
+
+        assert result == [{"id": str(i)} for i in range(3)]
+        assert [batch.add.call_count for batch in batches] == [3, 2, 1]
+        assert mock_sleep.call_args_list == [mock.call(2), mock.call(4)]
+
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.time.sleep")
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_conn")
+    def test_create_events_batch_reports_created_and_failed_events(self, mock_get_conn, mock_sleep):
+        bad_request = HttpError(resp=httplib2.Response({"status": 400}), content=b"Bad Request")
+        batches = self._mock_batches(mock_get_conn.return_value, failures={"0": [bad_request]})
+
+        with pytest.raises(GoogleCalendarBatchError, match="1 of 51 events could not be created") as ctx:
+            self.hook.create_events_batch(events=[EVENT] * 51, calendar_id=CALENDAR_ID)
+
+        assert ctx.value.errors == {0: bad_request}
+        assert ctx.value.created == {i: {"id": str(i)} for i in range(1, 51)}
+        # Every batch is sent, and errors that are not worth retrying are not retried
+        assert [batch.add.call_count for batch in batches] == [50, 1]
+        mock_sleep.assert_not_called()
+
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarHook.get_conn")
+    def test_create_events_batch_validates_all_events_first(self, mock_get_conn):
+        with pytest.raises(AirflowException, match="start and end must be specified"):
+            self.hook.create_events_batch(events=[EVENT, {"summary": "no dates"}], calendar_id=CALENDAR_ID)
+        mock_get_conn.return_value.new_batch_http_request.assert_not_called()
+
+
+class TestGoogleCalendarAsyncHook:
+    def setup_method(self):
+        self.hook = GoogleCalendarAsyncHook(api_version="v3", gcp_conn_id=GCP_CONN_ID)
+
+    @staticmethod
+    def _mock_session(pages):
+        responses = []
+        for page in pages:
+            response = mock.MagicMock()
+            response.json = mock.AsyncMock(return_value=page)
+            context = mock.MagicMock()
+            context.__aenter__ = mock.AsyncMock(return_value=response)
+            context.__aexit__ = mock.AsyncMock(return_value=None)
+            responses.append(context)
+        session = mock.MagicMock()
+        session.get.side_effect = responses
+        return session
+
+    @pytest.mark.asyncio
+    @mock.patch("airflow.providers.google.suite.hooks.calendar.GoogleCalendarAsyncHook.get_token")
+    async def test_get_events_follows_pages(self, mock_get_token):
+        mock_get_token.return_value.get = mock.AsyncMock(return_value="token")
+        session = self._mock_session(
+            [
+                {"items": [EVENT], "nextPageToken": "page-2"},
+                {"items": [EVENT]},
+            ]
+        )
+
+        result = await self.hook.get_events(calendar_id=CALENDAR_ID, session=session)
+
+        assert result == [EVENT, EVENT]
+        url = f"https://www.googleapis.com/calendar/v3/calendars/{CALENDAR_ID}/events"
+        headers = {"Authorization": "Bearer token"}
+        params = {"showDeleted": "false", "showHiddenInvitations": "false", "singleEvents": "false"}
+        assert session.get.call_args_list == [
+            mock.call(url, params=params, headers=headers),
+            mock.call(url, params={**params, "pageToken": "page-2"}, headers=headers),
+        ]
@@ -17,7 +17,6 @@
 # under the License.
 from __future__ import annotations
 
-import codecs
 import io
 import itertools
 import logging
@@ -40,6 +39,7 @@ from .percent_formatter import PercentFormatRender
 if TYPE_CHECKING:
     from structlog.typing import (
         BindableLogger,
+        Context,
         EventDict,
         Processor,
         WrappedLogger,
@@ -104,10 +104,17 @@ def _make_airflow_structlogger(min_level):
 
     base = structlog.make_filtering_bound_logger(min_level)
 
+    def __init__(self, logger: WrappedLogger, processors: Iterable[Processor], context: Context):
+        # Resolve the logger name once when the logger is bound, rather than for every log event
+        if logger_name := (context.pop("logger_name", None) or getattr(logger, "name", None)):
+            context.setdefault("logger", logger_name)
+        base.__init__(self, logger, processors, context)
+
     cls = type(
         f"AirflowBoundLoggerFilteringAt{LEVEL_TO_NAME.get(min_level, 'Notset').capitalize()}",
         (base,),
         {
+            "__init__": __init__,
             "isEnabledFor": base.is_enabled_for,
             "getEffectiveLevel": base.get_effective_level,
             "level": level,
@@ -144,11 +151,12 @@ def make_filtering_logger() -> Callable[..., BindableLogger]:
         # If the logger is a NamedBytesLogger/NamedWriteLogger (an Airflow specific subclass) then
         # look up the global per-logger config and redirect to a new class.
 
-        logger_name = kwargs.get("context", {}).get("logger_name")
+        context = kwargs.get("context", {})
+        logger_name = context.get("logger_name") or context.get("logger")
         if not logger_name and isinstance(logger, (NamedWriteLogger, NamedBytesLogger)):
             logger_name = logger.name
 
-        if (level_override := kwargs.get("context", {}).pop("__level_override", None)) is not None:
+        if (level_override := context.pop("__level_override", None)) is not None:
             level = level_override
         elif logger_name:
             level = PER_LOGGER_LEVELS.longest_prefix(logger_name).get(PER_LOGGER_LEVELS[""])
@@ -195,23 +203,29 @@ class LoggerFactory(Generic[LogOutputType]):
         return self.cls(logger_name, self.io)
 
 
-def logger_name(logger: Any, method_name: Any, event_dict: EventDict) -> EventDict:
-    if logger_name := (event_dict.pop("logger_name", None) or getattr(logger, "name", None)):
-        event_dict.setdefault("logger", logger_name)
-    return event_dict
+class StdBinaryStreamHandler(logging.StreamHandler):
+    """A logging.StreamHandler that writes each record as a single UTF-8 encoded line to a binary stream."""
+
+    stream: BinaryIO
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            msg = self.format(record)
+            self.stream.write((msg + self.terminator).encode("utf-8", "backslashreplace"))
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 # `eyJ` is `{"` in base64 encoding -- and any value that starts like that is in high likely hood a JWT
 # token. Better safe than sorry
 def redact_jwt(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
     for k, v in event_dict.items():
-        if isinstance(v, str):
-            event_dict[k] = re.sub(JWT_PATTERN, "eyJ***", v)
-    return event_dict
-
-
-def drop_positional_args(logger: Any, method_name: Any, event_dict: EventDict) -> EventDict:
-    event_dict.pop("positional_args", None)
+        # The substring check is much cheaper than running the regex, and is false for almost every value
+        if isinstance(v, str) and "eyJ" in v:
+            event_dict[k] = JWT_PATTERN.sub("eyJ***", v)
     return event_dict
 
 
@@ -223,6 +237,25 @@ def respect_stdlib_disable(logger: Any, method_name: Any, event_dict: EventDict)
     return event_dict
 
 
+def _json_fallback(obj: Any) -> Any:
+    # Same as structlog's default for JSONRenderer: let objects render themselves, or fall back to their repr
+    try:
+        return obj.__structlog__()
+    except AttributeError:
+        return repr(obj)
+
+
+def _module_dirs(*names: str) -> tuple[str, ...]:
+    """Return the directories of the given top-level modules that are installed, without importing them."""
+    from importlib.util import find_spec
+
+    dirs: tuple[str, ...] = ()
+    for name in names:
+        if (spec := find_spec(name)) is not None and spec.origin:
+            dirs += (os.path.dirname(spec.origin),)
+    return dirs
+
+
 @cache
 def structlog_processors(
     json_output: bool,
@@ -253,7 +286,6 @@ def structlog_processors(
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        logger_name,
         redact_jwt,
         structlog.processors.StackInfoRenderer(),
     ]
@@ -275,26 +307,9 @@ def structlog_processors(
             structlog.processors.CallsiteParameterAdder(callsite_parameters, additional_ignores=[__name__])
         )
 
-    # Imports to suppress showing code from these modules. We need the import to get the filepath for
-    # structlog to ignore.
-
-    import contextlib
-
-    import click
-
-    suppress = (click, contextlib)
-    try:
-        import httpcore
-
-        suppress += (httpcore,)
-    except ImportError:
-        pass
-    try:
-        import httpx
-
-        suppress += (httpx,)
-    except ImportError:
-        pass
+    # Suppress showing code from these modules. structlog only needs their paths, so look them up without
+    # importing them -- that keeps these (fairly heavy) imports out of the startup of every task process
+    suppress = _module_dirs("click", "contextlib", "httpcore", "httpx")
 
     if json_output:
         dict_exc_formatter = structlog.tracebacks.ExceptionDictTransformer(
@@ -305,6 +320,9 @@ def structlog_processors(
 
         import msgspec
 
+        # Reusing a single encoder is cheaper than `msgspec.json.encode` setting one up for every record
+        encoder = msgspec.json.Encoder(enc_hook=_json_fallback)
+
         def json_dumps(msg, default):
             # Note: this is likely an "expensive" step, but lets massage the dict order for nice
             # viewing of the raw JSON logs.
@@ -315,10 +333,13 @@ def structlog_processors(
                 "event": msg.pop("event"),
                 **msg,
             }
-            return msgspec.json.encode(msg, enc_hook=default)
+            # `default` is always `_json_fallback`, which the encoder already uses
+            return encoder.encode(msg)
 
-        json = structlog.processors.JSONRenderer(serializer=json_dumps)
+        json = structlog.processors.JSONRenderer(serializer=json_dumps, default=_json_fallback)
 
+        # structlog-native loggers write the encoded bytes from `json` straight to the output. Only the
+        # stdlib path needs a str, as `ProcessorFormatter` requires its last processor to return one.
         def json_processor(logger: Any, method_name: Any, event_dict: EventDict) -> str:
             return json(logger, method_name, event_dict).decode("utf-8")
 
@@ -463,19 +484,24 @@ def configure_logging(
         callsite_parameters=tuple(callsite_parameters or ()),
     )
     shared_pre_chain += list(extra_processors)
+    # structlog loggers have their name resolved when they are bound, stdlib records get it from the record
     pre_chain: list[structlog.typing.Processor] = [structlog.stdlib.add_logger_name] + shared_pre_chain
 
     # Don't cache the loggers during tests, it make it hard to capture them
     if "PYTEST_VERSION" in os.environ:
         cache_logger_on_first_use = False
 
-    std_lib_formatter: list[Processor] = [
-        # TODO: Don't include this if we are using PercentFormatter -- it'll delete something we
+    def render_stdlib_record(logger: Any, method_name: Any, event_dict: EventDict) -> str:
+        # Same as running ProcessorFormatter.remove_processors_meta followed by `for_stdlib`, but in one
+        # call per record.
+        # TODO: Don't remove `_record` if we are using PercentFormatter -- it'll delete something we
         # just have to recerated!
-        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
-        drop_positional_args,
-        for_stdlib,
-    ]
+        # No need to drop `positional_args` here, PositionalArgumentsFormatter in the pre-chain removes them
+        del event_dict["_record"]
+        del event_dict["_from_structlog"]
+        return for_stdlib(logger, method_name, event_dict)
+
+    std_lib_formatter: list[Processor] = [render_stdlib_record]
 
     wrapper_class = cast("type[BindableLogger]", make_filtering_logger())
     if json_output:
@@ -523,14 +549,16 @@ def configure_logging(
             # log_config.pop("handlers", None)
 
     if output and not hasattr(output, "encoding"):
-        # This is a BinaryIO, we need to give logging.StreamHandler a TextIO
-        output = codecs.lookup("utf-8").streamwriter(output)  # type: ignore
+        # This is a BinaryIO, write the encoded lines straight to it
+        handler_class: dict[str, Any] = {"()": StdBinaryStreamHandler}
+    else:
+        handler_class = {"class": "logging.StreamHandler"}
 
     config["handlers"].update(
         {
             "default": {
+                **handler_class,
                 "level": log_level.upper(),
-                "class": "logging.StreamHandler",
                 "formatter": "structlog",
                 "stream": output,
             },
@@ -578,10 +606,24 @@ def init_log_folder(directory: str | os.PathLike[str], new_folder_permissions: i
     sure that the same group is set as default group for both - impersonated user and main airflow
     user.
     """
-    directory = Path(directory)
-    for parent in reversed(Path(directory).parents):
-        parent.mkdir(mode=new_folder_permissions, exist_ok=True)
-    directory.mkdir(mode=new_folder_permissions, exist_ok=True)
+    # This is on the path of every task start, so work on the path as given rather than building Path objects
+    directory = os.fspath(directory)
+    try:
+        # Most of the time (e.g. on task retries) the folder is already there, so try it first
+        os.mkdir(directory, new_folder_permissions)
+    except FileNotFoundError:
+        # Only walk up as far as needed, so each missing parent is created with the same mode. The parent
+        # is taken from the path as given: normalizing it would resolve ".." through folders that don't
+        # exist yet
+        parent = os.path.dirname(directory.rstrip(os.sep))
+        if not parent:
+            raise
+        init_log_folder(parent, new_folder_permissions)
+        init_log_folder(directory, new_folder_permissions)
+    except OSError:
+        # Not only EEXIST, e.g. a read-only file system reports EROFS even if the folder is there
+        if not os.path.isdir(directory):
+            raise
 
 
 def init_log_file(
@@ -604,7 +646,6 @@ def init_log_file(
     try:
         full_path.touch(new_file_permissions)
     except OSError as e:
-        log = structlog.get_logger(__name__)
         log.warning("OSError while changing ownership of the log file. %s", e)
 
     return full_path
@@ -618,10 +659,15 @@ def reconfigure_logger(
         procs = structlog.get_config()["processors"]
     procs = [proc for proc in procs if not isinstance(proc, without_processor_type)]
 
+    context = dict(getattr(logger, "_context", {}))
+    # Bound loggers keep their name under `logger`, which would clash with wrap_logger's own argument
+    if "logger" in context:
+        context["logger_name"] = context.pop("logger")
+
     return structlog.wrap_logger(
         getattr(logger, "_logger", None),
         processors=procs,
-        **getattr(logger, "_context", {}),
+        **context,
         __level_override=level_override,
     )
 
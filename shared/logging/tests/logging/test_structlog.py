@@ -254,6 +254,92 @@ def test_json(structlog_config, get_logger, config_kwargs, log_kwargs, expected_
     }
 
 
+def test_json_key_order(structlog_config):
+    with structlog_config(json_output=True) as bio:
+        structlog.get_logger("my.logger").info("Hello", key1="value1")
+
+    assert bio.getvalue() == (
+        b'{"timestamp":"1985-10-26T00:00:00.000001Z","level":"info","event":"Hello",'
+        b'"logger":"my.logger","key1":"value1"}\n'
+    )
+
+
+def test_processors_do_not_import_suppressed_modules():
+    with mock.patch.dict(sys.modules):
+        sys.modules.pop("click", None)
+        structlog_module.structlog_processors.__wrapped__(json_output=True)
+        assert "click" not in sys.modules
+
+
+def test_json_stdlib_non_ascii(structlog_config):
+    with structlog_config(json_output=True) as bio:
+        logging.getLogger("my.logger").info("Héllo wörld")
+
+    written = bio.getvalue()
+    assert written.endswith(b"}\n")
+    assert json.loads(written)["event"] == "Héllo wörld"
+
+
+def test_std_binary_stream_handler_single_write():
+    stream = mock.MagicMock(spec=io.RawIOBase)
+    handler = structlog_module.StdBinaryStreamHandler(stream)
+
+    handler.emit(logging.makeLogRecord({"msg": "Héllo"}))
+
+    stream.write.assert_called_once_with("Héllo\n".encode())
+
+
+def test_json_bound_logger_name(structlog_config):
+    with structlog_config(json_output=True) as bio:
+        log = structlog.get_logger(logger_name="my.logger").bind(key1="value1")
+        log.info("Hello")
+        log.info("Hello", logger="other.logger")
+
+    first, second = map(json.loads, bio.getvalue().splitlines())
+    assert first["logger"] == "my.logger"
+    assert "logger_name" not in first
+    assert second["logger"] == "other.logger"
+
+
+def test_json_stdlib_positional_args(structlog_config):
+    with structlog_config(json_output=True) as bio:
+        logging.getLogger("my.logger").info("Hello %s", "world")
+
+    written = json.load(bio)
+    assert written["event"] == "Hello world"
+    assert "positional_args" not in written
+
+
+def test_json_non_serializable_values(structlog_config):
+    class Custom:
+        def __repr__(self):
+            return "<Custom>"
+
+    class RendersItself:
+        def __structlog__(self):
+            return {"rendered": True}
+
+    with structlog_config(json_output=True) as bio:
+        structlog.get_logger("my.logger").info("Hello", custom=Custom(), own=RendersItself())
+
+    written = json.load(bio)
+    assert written["custom"] == "<Custom>"
+    assert written["own"] == {"rendered": True}
+
+
+def test_json_renderers():
+    _, for_stdlib, for_structlog = structlog_module.structlog_processors(json_output=True)
+
+    event_dict = {"timestamp": "1985-10-26T00:00:00.000001Z", "level": "info", "event": "Hello"}
+    # structlog-native loggers get bytes to write directly, only the stdlib formatter needs a str
+    assert for_structlog(None, "info", dict(event_dict)) == (
+        b'{"timestamp":"1985-10-26T00:00:00.000001Z","level":"info","event":"Hello"}'
+    )
+    assert for_stdlib(None, "info", dict(event_dict)) == (
+        '{"timestamp":"1985-10-26T00:00:00.000001Z","level":"info","event":"Hello"}'
+    )
+
+
 @pytest.mark.parametrize(
     ("get_logger"),
     [
@@ -367,3 +453,93 @@ def test_logger_filtering(structlog_config, levels):
         [other.logger] Hello key1=value4
         [my.logger.sub] Hello key1=value5
         """)
+
+
+def test_reconfigure_logger_keeps_name_and_level(structlog_config):
+    with structlog_config(
+        json_output=True,
+        log_level="DEBUG",
+        namespace_log_levels={"my.logger": "warn", "task": "error"},
+    ) as bio:
+        bound = structlog.get_logger("my.logger").bind(key1="value1")
+        log = structlog_module.reconfigure_logger(bound, structlog.processors.CallsiteParameterAdder)
+        log.info("Hidden")
+        log.warning("Hello")
+
+        wrapped = structlog.wrap_logger(
+            structlog.BytesLogger(bio), processors=structlog.get_config()["processors"], logger_name="task"
+        ).bind()
+        task_log = structlog_module.reconfigure_logger(wrapped, structlog.processors.CallsiteParameterAdder)
+        task_log.warning("Hidden")
+        task_log.error("Hello task")
+
+    first, second = map(json.loads, bio.getvalue().splitlines())
+    assert first["event"] == "Hello"
+    assert first["logger"] == "my.logger"
+    assert first["key1"] == "value1"
+    assert second["event"] == "Hello task"
+    assert second["logger"] == "task"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param("eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiIxIn0.abc-_", "eyJ***", id="jwt"),
+        pytest.param("token=eyJhbGciOiJIUzI1NiJ9.e30.x rest", "token=eyJ*** rest", id="embedded-jwt"),
+        pytest.param("no token here", "no token here", id="plain-str"),
+        pytest.param(42, 42, id="non-str"),
+    ],
+)
+def test_redact_jwt(value, expected):
+    event_dict = {"event": "Hello", "value": value}
+    assert structlog_module.redact_jwt(None, "info", event_dict) == {"event": "Hello", "value": expected}
+
+
+def test_init_log_folder(tmp_path):
+    old_umask = os.umask(0o027)
+    try:
+        base_dir = tmp_path / "base"
+        base_dir.mkdir()
+        log_dir = base_dir / "subdir1" / "subdir2"
+
+        structlog_module.init_log_folder(log_dir, 0o700)
+        # Existing folders are left as they are
+        structlog_module.init_log_folder(log_dir, 0o755)
+
+        assert log_dir.is_dir()
+        assert log_dir.stat().st_mode % 0o1000 == 0o700
+        assert log_dir.parent.stat().st_mode % 0o1000 == 0o700
+        assert base_dir.stat().st_mode % 0o1000 == 0o750
+    finally:
+        os.umask(old_umask)
+
+
+def test_init_log_folder_with_parent_reference(tmp_path):
+    log_dir = os.path.join(tmp_path, "missing", "..", "logs", "dag_id=x")
+
+    structlog_module.init_log_folder(log_dir, 0o775)
+
+    assert (tmp_path / "missing").is_dir()
+    assert (tmp_path / "logs" / "dag_id=x").is_dir()
+
+
+def test_init_log_folder_existing_folder_mkdir_error(tmp_path):
+    with mock.patch("os.mkdir", side_effect=PermissionError(13, "Permission denied")):
+        structlog_module.init_log_folder(tmp_path, 0o775)
+
+        with pytest.raises(PermissionError):
+            structlog_module.init_log_folder(tmp_path / "missing", 0o775)
+
+
+def test_init_log_file(tmp_path):
+    full_path = structlog_module.init_log_file(tmp_path, "dag_id=a/run_id=b/attempt=1.log")
+
+    assert full_path == tmp_path / "dag_id=a" / "run_id=b" / "attempt=1.log"
+    assert full_path.is_file()
+
+
+def test_init_log_folder_existing_file(tmp_path):
+    (tmp_path / "file").touch()
+
+    with pytest.raises(FileExistsError):
+        structlog_module.init_log_folder(tmp_path / "file", 0o755)
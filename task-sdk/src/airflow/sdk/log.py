@@ -121,7 +121,10 @@ def configure_logging(
         callsite_parameters=callsite_params,
     )
 
-    global _warnings_showwarning
+    global _warnings_showwarning, _py_warnings_log
+
+    # Don't keep using a logger created with the previous config
+    _py_warnings_log = None
 
     if _warnings_showwarning is None:
         _warnings_showwarning = warnings.showwarning
@@ -138,25 +141,36 @@ def logger_at_level(name: str, level: int) -> Logger:
     )
 
 
-def init_log_file(local_relative_path: str) -> Path:
+@cache
+def _log_file_settings() -> tuple[str, int, int]:
     """
-    Ensure log file and parent directories are created.
+    Return the base log folder and the new folder/file permissions from config.
 
-    Any directories that are missing are created with the right permission bits.
+    These are read once per process; :func:`reset_logging` clears the cache.
     """
     from airflow.configuration import conf
-    from airflow.sdk._shared.logging import init_log_file
 
-    new_file_permissions = int(
-        conf.get("logging", "file_task_handler_new_file_permissions", fallback="0o664"),
-        8,
-    )
+    base_log_folder = conf.get("logging", "base_log_folder")
     new_folder_permissions = int(
         conf.get("logging", "file_task_handler_new_folder_permissions", fallback="0o775"),
         8,
     )
+    new_file_permissions = int(
+        conf.get("logging", "file_task_handler_new_file_permissions", fallback="0o664"),
+        8,
+    )
+    return base_log_folder, new_folder_permissions, new_file_permissions
 
-    base_log_folder = conf.get("logging", "base_log_folder")
+
+def init_log_file(local_relative_path: str) -> Path:
+    """
+    Ensure log file and parent directories are created.
+
+    Any directories that are missing are created with the right permission bits.
+    """
+    from airflow.sdk._shared.logging import init_log_file
+
+    base_log_folder, new_folder_permissions, new_file_permissions = _log_file_settings()
 
     return init_log_file(
         base_log_folder,
@@ -250,14 +264,32 @@ def reset_logging():
     """
     from airflow.sdk._shared.logging.structlog import structlog_processors
 
-    global _warnings_showwarning
+    global _warnings_showwarning, _py_warnings_log
     warnings.showwarning = _warnings_showwarning
     _warnings_showwarning = None
+    _py_warnings_log = None
     structlog_processors.cache_clear()
     logging_processors.cache_clear()
+    _log_file_settings.cache_clear()
 
 
 _warnings_showwarning: Any = None
+_py_warnings_log: Any = None
+
+
+def _py_warnings_logger() -> FilteringBoundLogger:
+    """Return the logger for warnings, creating it only once if structlog is set to cache loggers."""
+    global _py_warnings_log
+
+    if (log := _py_warnings_log) is None:
+        from airflow.sdk._shared.logging.structlog import reconfigure_logger
+
+        log = reconfigure_logger(
+            structlog.get_logger("py.warnings").bind(), structlog.processors.CallsiteParameterAdder
+        )
+        if structlog.get_config()["cache_logger_on_first_use"]:
+            _py_warnings_log = log
+    return log
 
 
 def _showwarning(
@@ -281,10 +313,6 @@ def _showwarning(
         if _warnings_showwarning is not None:
             _warnings_showwarning(message, category, filename, lineno, file, line)
     else:
-        from airflow.sdk._shared.logging.structlog import reconfigure_logger
-
-        log = reconfigure_logger(
-            structlog.get_logger("py.warnings").bind(), structlog.processors.CallsiteParameterAdder
+        _py_warnings_logger().warning(
+            str(message), category=category.__name__, filename=filename, lineno=lineno
         )
-
-        log.warning(str(message), category=category.__name__, filename=filename, lineno=lineno)
@@ -0,0 +1,69 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+import structlog
+
+from airflow.sdk import log as sdk_log
+
+
+@pytest.fixture
+def cache_loggers(captured_logs):
+    # Logging is configured not to cache loggers under pytest, turn it back on after captured_logs set it up
+    structlog.configure(cache_logger_on_first_use=True)
+    try:
+        yield
+    finally:
+        structlog.configure(cache_logger_on_first_use=False)
+
+
+def test_showwarning_logs_to_py_warnings(captured_logs, cache_loggers):
+    sdk_log._showwarning("Something is deprecated", DeprecationWarning, __file__, 42)
+
+    assert captured_logs == [
+        {
+            "category": "DeprecationWarning",
+            "event": "Something is deprecated",
+            "filename": __file__,
+            "level": "warning",
+            "lineno": 42,
+            "logger": "py.warnings",
+            "timestamp": mock.ANY,
+        }
+    ]
+
+    # The logger is created once and reused for the following warnings
+    cached_log = sdk_log._py_warnings_log
+    assert cached_log is not None
+    sdk_log._showwarning("Another warning", UserWarning, __file__, 43)
+    assert sdk_log._py_warnings_log is cached_log
+    assert [entry["event"] for entry in captured_logs] == ["Something is deprecated", "Another warning"]
+
+    sdk_log.reset_logging()
+    assert sdk_log._py_warnings_log is None
+
+
+def test_showwarning_does_not_cache_logger_when_loggers_are_not_cached(captured_logs, monkeypatch):
+    monkeypatch.setattr(sdk_log, "_py_warnings_log", None)
+    sdk_log._showwarning("Something is deprecated", DeprecationWarning, __file__, 42)
+
+    assert [entry["logger"] for entry in captured_logs] == ["py.warnings"]
+    assert sdk_log._py_warnings_log is None